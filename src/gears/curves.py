@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import numpy.typing as npt
 
@@ -26,8 +28,9 @@ def involute(t: ArrOrNum, r: float, a0: float = 0) -> npt.NDArray:
         Coordinates of the point (x, y).
     """
     t_ = t + a0
-    x = r * (np.cos(t_) + t * np.sin(t_))
-    y = r * (np.sin(t_) - t * np.cos(t_))
+    cos_t_, sin_t_ = np.cos(t_), np.sin(t_)
+    x = r * (cos_t_ + t * sin_t_)
+    y = r * (sin_t_ - t * cos_t_)
     return np.array([x, y])
 
 
@@ -46,8 +49,9 @@ def epitrochoid(t: ArrOrNum, R: float, r: float, d: float, a0: float = 0) -> npt
         Coordinates of the point (x, y).
     """
     t_ = t + a0
-    x = (R + r) * np.cos(t_) - d * np.cos(R * t / r + t_)
-    y = (R + r) * np.sin(t_) - d * np.sin(R * t / r + t_)
+    t__ = R * t / r + t_
+    x = (R + r) * np.cos(t_) - d * np.cos(t__)
+    y = (R + r) * np.sin(t_) - d * np.sin(t__)
     return np.array([x, y])
 
 
@@ -66,11 +70,107 @@ def epitrochoid_flat(t: ArrOrNum, R: float, l: float, a0: float = 0) -> npt.NDAr
         Coordinates of the point (x, y).
     """
     t_ = t + a0
-    x = (R - l) * np.cos(t_) + t * R * np.sin(t_)
-    y = (R - l) * np.sin(t_) - t * R * np.cos(t_)
+    cos_t_, sin_t_ = np.cos(t_), np.sin(t_)
+    x = (R - l) * cos_t_ + t * R * sin_t_
+    y = (R - l) * sin_t_ - t * R * cos_t_
     return np.array([x, y])
 
 
-involute_angrad = make_angrad_func(involute)
-epitrochoid_angrad = make_angrad_func(epitrochoid)
-epitrochoid_flat_angrad = make_angrad_func(epitrochoid_flat)
+def circle_t_range(t_lims: tuple[float, float], step: float, r: float) -> npt.NDArray:
+    """
+    Values of t, which split the circle arc into equal segments. The arc length is r * t, so no iterations are needed.
+
+    Args:
+        t_lims: Top and bottom limits of the parametr t.
+        step: Desired distance between points.
+        r: Circle radius.
+
+    Returns:
+        Array of t params.
+    """
+    t_st, t_en = t_lims
+    seg_num = max(int(np.ceil(r * abs(t_en - t_st) / step)), 1)
+    return np.linspace(t_st, t_en, seg_num + 1)
+
+
+def involute_t_range(t_lims: tuple[float, float], step: float, r: float) -> npt.NDArray:
+    """
+    Values of t, which split the involute into equal segments. The arc length is r * t^2 / 2, so no iterations are
+    needed.
+
+    Args:
+        t_lims: Top and bottom limits of the parametr t, both non-negative.
+        step: Desired distance between points.
+        r: Circle radius.
+
+    Returns:
+        Array of t params.
+    """
+    t_st, t_en = t_lims
+    arc_st, arc_en = r * t_st ** 2 / 2, r * t_en ** 2 / 2
+    seg_num = max(int(np.ceil(abs(arc_en - arc_st) / step)), 1)
+    return np.sqrt(np.linspace(arc_st, arc_en, seg_num + 1) * 2 / r)
+
+
+def involute_scalar(t: float, r: float, a0: float = 0) -> tuple[float, float]:
+    """Scalar version of involute for the iterative solvers. The math functions skip numpy dispatch on floats."""
+    t_ = t + a0
+    cos_t_, sin_t_ = math.cos(t_), math.sin(t_)
+    return r * (cos_t_ + t * sin_t_), r * (sin_t_ - t * cos_t_)
+
+
+def epitrochoid_scalar(t: float, R: float, r: float, d: float, a0: float = 0) -> tuple[float, float]:
+    """Scalar version of epitrochoid for the iterative solvers."""
+    t_ = t + a0
+    t__ = R * t / r + t_
+    return (R + r) * math.cos(t_) - d * math.cos(t__), (R + r) * math.sin(t_) - d * math.sin(t__)
+
+
+def epitrochoid_flat_scalar(t: float, R: float, l: float, a0: float = 0) -> tuple[float, float]:  # noqa: E741
+    """Scalar version of epitrochoid_flat for the iterative solvers."""
+    t_ = t + a0
+    cos_t_, sin_t_ = math.cos(t_), math.sin(t_)
+    return (R - l) * cos_t_ + t * R * sin_t_, (R - l) * sin_t_ - t * R * cos_t_
+
+
+def epitrochoid_with_deriv(t: float, R: float, r: float, d: float, a0: float = 0) -> tuple[float, float, float, float]:
+    """Scalar epitrochoid and its derivatives: x, y, dx/dt, dy/dt."""
+    t_ = t + a0
+    t__ = R * t / r + t_
+    cos_t_, sin_t_, cos_t__, sin_t__ = math.cos(t_), math.sin(t_), math.cos(t__), math.sin(t__)
+    d_ = d * (R / r + 1)  # Derivative of d * cos(t__) or d * sin(t__) by t, up to the trig factor
+    return ((R + r) * cos_t_ - d * cos_t__, (R + r) * sin_t_ - d * sin_t__,
+            d_ * sin_t__ - (R + r) * sin_t_, (R + r) * cos_t_ - d_ * cos_t__)
+
+
+def epitrochoid_flat_with_deriv(t: float, R: float, l: float, a0: float = 0) -> (  # noqa: E741
+        tuple[float, float, float, float]):
+    """Scalar epitrochoid_flat and its derivatives: x, y, dx/dt, dy/dt."""
+    t_ = t + a0
+    cos_t_, sin_t_ = math.cos(t_), math.sin(t_)
+    return ((R - l) * cos_t_ + t * R * sin_t_, (R - l) * sin_t_ - t * R * cos_t_,
+            l * sin_t_ + t * R * cos_t_, t * R * sin_t_ - l * cos_t_)
+
+
+def involute_angrad(rad: float, t_min: float, t_max: float, r: float, a0: float = 0) -> (
+        tuple[float, float, float, float]):
+    """
+    Explicit function f(radius) -> angle of the involute. The radius is r * sqrt(1 + t^2), so t is found in closed form.
+
+    Args:
+        rad: Radial distance, not less than r.
+        t_min: Unused, kept for compatibility with the other angrad functions.
+        t_max: Unused, kept for compatibility with the other angrad functions.
+        r: Circle radius.
+        a0: Rotation angle.
+
+    Returns:
+        Angle, x, y, t.
+    """
+    t = math.sqrt(max((rad - r) * (rad + r), 0)) / r
+    x, y = involute_scalar(t, r, a0)
+    return math.atan2(y, x), x, y, t
+
+
+epitrochoid_angrad = make_angrad_func(epitrochoid_scalar, epitrochoid_with_deriv)
+epitrochoid_flat_angrad = make_angrad_func(epitrochoid_flat_scalar, epitrochoid_flat_with_deriv)
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from .helpers import replace_batch
@@ -63,7 +65,7 @@ class GearParams:
         self.root_radius = self.root_diameter / 2
 
     def _calc_base_diameter(self) -> None:
-        self.base_diameter = self.pitch_diameter * np.cos(self.pressure_angle_rad)
+        self.base_diameter = self.pitch_diameter * math.cos(self.pressure_angle_rad)
         self.base_radius = self.base_diameter / 2
 
     def _calc_tooth_angle(self) -> None:
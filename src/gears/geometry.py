@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import numpy.typing as npt
 
@@ -24,7 +26,7 @@ def linecirc_intersec(x1: float, y1: float, x2: float, y2: float, cntr_x: float,
     """
     dx = x2 - x1
     dy = y2 - y1
-    dr = np.linalg.norm([dx, dy])  # type: ignore[attr-defined]
+    dr = math.hypot(dx, dy)
     D = np.linalg.det(np.array([[x1 - cntr_x, x2 - cntr_x], [y1 - cntr_y, y2 - cntr_y]]))  # type: ignore[attr-defined]
     dr2 = np.square(dr)
     discriminant = np.square(radlen) * dr2 - np.square(D)
@@ -43,6 +45,43 @@ def linecirc_intersec(x1: float, y1: float, x2: float, y2: float, cntr_x: float,
         raise RuntimeError('No line-circumference intersection!')
 
 
+def linecirc_intersec_arr(x1: float, y1: float, x2: float, y2: float, cntr_x: npt.ArrayLike, cntr_y: npt.ArrayLike,
+                          radlen: npt.ArrayLike) -> npt.NDArray:
+    """
+    Find intersections of one line with several circles. Vectorized version of linecirc_intersec.
+
+    Args:
+        x1: Line, point 1 x.
+        y1: Line, point 1 y.
+        x2: Line, point 2 x.
+        y2: Line, point 2 y.
+        cntr_x: Circle centers x.
+        cntr_y: Circle centers y.
+        radlen: Radii of the circles.
+
+    Returns:
+        Two points per circle [[x_es...], [y_es...]]: the first points of all circles, then the second ones. The tangent
+        point is repeated twice.
+
+    Raises:
+        RuntimeError: Line and some circumference does not have common points.
+    """
+    cntr_x = np.asarray(cntr_x)
+    cntr_y = np.asarray(cntr_y)
+    dx = x2 - x1
+    dy = y2 - y1
+    dr2 = dx * dx + dy * dy
+    D = (x1 - cntr_x) * (y2 - cntr_y) - (x2 - cntr_x) * (y1 - cntr_y)  # Determinant per circle
+    discriminant = np.square(radlen) * dr2 - np.square(D)
+    if np.any(discriminant < 0):
+        raise RuntimeError('No line-circumference intersection!')
+    sgn = -1 if dy < 0 else 1
+    sqrt_disc = np.sqrt(discriminant) * np.array([[1], [-1]])  # Both roots, shape (2, circles)
+    x_es = (D * dy + sgn * dx * sqrt_disc) / dr2 + cntr_x
+    y_es = (- D * dx + abs(dy) * sqrt_disc) / dr2 + cntr_y
+    return np.array([x_es.ravel(), y_es.ravel()])
+
+
 def lineline_intersec(x1: float, y1: float, x2: float, y2: float,
                       x3: float, y3: float, x4: float, y4: float) -> tuple[float, float]:
     """
@@ -81,7 +120,7 @@ def lineline_intersec(x1: float, y1: float, x2: float, y2: float,
 
 
 def get_unit_vector(vec: npt.NDArray) -> npt.NDArray:
-    return vec / np.linalg.norm(vec)  # type: ignore[attr-defined]
+    return vec / math.hypot(*vec)
 
 
 def is_within_ang(q_ang: float, st_ang: float, en_ang: float) -> bool:
@@ -89,6 +128,28 @@ def is_within_ang(q_ang: float, st_ang: float, en_ang: float) -> bool:
     return operator(st_ang <= q_ang, q_ang < en_ang)  # type: ignore[operator]
 
 
+def is_within_ang_scalar(q_ang: float, st_ang: float, en_ang: float) -> bool:
+    """Same as is_within_ang, but for scalars only. Plain Python comparisons avoid numpy dispatch."""
+    return st_ang <= q_ang < en_ang if st_ang < en_ang else (st_ang <= q_ang or q_ang < en_ang)
+
+
+def is_within_ang_intervals(q_ang: float, st_angs: npt.NDArray, en_angs: npt.NDArray) -> npt.NDArray:
+    """
+    Checks which of the angular intervals contain the angle. Vectorized version of is_within_ang over the intervals.
+
+    Args:
+        q_ang: Query angle, in radians.
+        st_angs: Interval start angles, including, in radians.
+        en_angs: Interval end angles, excluding, in radians.
+
+    Returns:
+        Boolean mask of the intervals, which contain the angle.
+    """
+    is_after_st = st_angs <= q_ang
+    is_before_en = q_ang < en_angs
+    return (is_after_st & is_before_en) | ((st_angs >= en_angs) & (is_after_st | is_before_en))
+
+
 def angle_vec(vec0: npt.NDArray, vec1: npt.NDArray) -> npt.NDArray:  # Not used here!
     """
     Returns the angle between two vectors. If the vector 0 is rotated ACW to get the same direction as vector 1, then
@@ -101,6 +162,6 @@ def angle_vec(vec0: npt.NDArray, vec1: npt.NDArray) -> npt.NDArray:  # Not used
     Returns:
         Angle between two vectors, in radians. -1 < angle <= 1.
     """
-    y = np.linalg.det(np.vstack((vec0, vec1)))  # type: ignore[attr-defined]
-    x = np.sum(vec0 * vec1)
+    y = vec0[0] * vec1[1] - vec0[1] * vec1[0]  # Cross product
+    x = vec0[0] * vec1[0] + vec0[1] * vec1[1]  # Dot product
     return np.arctan2(y, x)
@@ -490,12 +490,13 @@ class GearsApp(Tk):
         self.after_id: Optional[str] = None
 
     # Show or hide elements
-    def show_gear(self, idx: int) -> None:
+    def show_gear(self, idx: int, is_redraw: bool = True) -> None:
         """
         Show or hide a gear depending on the corresponding checkbox variable.
 
         Args:
             idx: Gear index.
+            is_redraw: Redraw the canvas at once.
 
         Returns:
             None.
@@ -503,55 +504,69 @@ class GearsApp(Tk):
         if self.active_mode:
             flag = self.menubar.has_gears[idx].get()
             self.ax.patches[idx].set_visible(flag)  # type: ignore[attr-defined]
-            data = self.gear_sectors[idx].get_data()
-            data[0] += bool_to_sign(idx) * self.teeth[idx].pitch_radius
-            self.plot_data(self.ax.lines[idx],  # type: ignore[attr-defined]
-                           *(data if flag else np.array([[], []])))
+            x_vals, y_vals = self.gear_sectors[idx].get_data() if flag else np.array([[], []])
+            x_vals = x_vals + bool_to_sign(idx) * self.teeth[idx].pitch_radius
+            self.plot_data(self.ax.lines[idx], x_vals, y_vals, is_redraw=is_redraw)  # type: ignore[attr-defined]
 
-    def show_action_lines(self) -> None:
+    def show_action_lines(self, is_redraw: bool = True) -> None:
         """
         Show or hide the action line depending on the corresponding checkbox variable.
 
+        Args:
+            is_redraw: Redraw the canvas at once.
+
         Returns:
             None.
         """
         flag = self.menubar.has_action_line.get() and self.active_mode and hasattr(self, 'transmission')
-        self.plot_data(self.ax.lines[2],  # type: ignore[attr-defined]
-                       *(self.transmission.action_line0data if flag else np.array([[], []])))
-        self.plot_data(self.ax.lines[3],  # type: ignore[attr-defined]
-                       *(self.transmission.action_line1data if flag else np.array([[], []])))
+        x_vals, y_vals = self.transmission.action_line0data if flag else np.array([[], []])
+        self.plot_data(self.ax.lines[2], x_vals, y_vals, is_redraw=False)  # type: ignore[attr-defined]
+        x_vals, y_vals = self.transmission.action_line1data if flag else np.array([[], []])
+        self.plot_data(self.ax.lines[3], x_vals, y_vals, is_redraw=is_redraw)  # type: ignore[attr-defined]
 
-    def show_contact_points(self) -> None:
+    def show_contact_points(self, is_redraw: bool = True) -> None:
         """
         Show or hide the contact points depending on the corresponding checkbox variable.
 
+        Args:
+            is_redraw: Redraw the canvas at once.
+
         Returns:
             None.
         """
         flag = self.menubar.has_contact_pts.get() and self.active_mode and hasattr(self, 'transmission')
-        self.plot_data(self.ax.lines[4],  # type: ignore[attr-defined]
-                       *(self.transmission.get_data()[0] if flag else np.array([[], []])))
-        self.plot_data(self.ax.lines[5],  # type: ignore[attr-defined]
-                       *(self.transmission.get_data()[1] if flag else np.array([[], []])))
+        contacts0_data, contacts1_data = self.transmission.get_data() if flag else (np.array([[], []]),) * 2
+        x_vals, y_vals = contacts0_data
+        self.plot_data(self.ax.lines[4], x_vals, y_vals, is_redraw=False)  # type: ignore[attr-defined]
+        x_vals, y_vals = contacts1_data
+        self.plot_data(self.ax.lines[5], x_vals, y_vals, is_redraw=is_redraw)  # type: ignore[attr-defined]
 
-    def show_rack(self) -> None:
+    def show_rack(self, is_redraw: bool = True) -> None:
         """
         Show or hide the rack depending on the corresponding checkbox variable.
 
+        Args:
+            is_redraw: Redraw the canvas at once.
+
         Returns:
             None.
         """
         flag = self.menubar.has_rack.get() and self.active_mode
-        self.plot_data(self.ax.lines[6],  # type: ignore[attr-defined]
-                       *(self.rack.get_data() if flag else np.array([[], []])))
+        x_vals, y_vals = self.rack.get_data() if flag else np.array([[], []])
+        self.plot_data(self.ax.lines[6], x_vals, y_vals, is_redraw=is_redraw)  # type: ignore[attr-defined]
 
     # Matplotlib funcs
     def on_key_press(self, event: KeyEvent) -> None:
         key_press_handler(event, self.canvas, self.toolbar)
 
-    def plot_data(self, line: Line2D, x_vals: npt.NDArray, y_vals: npt.NDArray) -> None:
+    def plot_data(self, line: Line2D, x_vals: npt.NDArray, y_vals: npt.NDArray, is_redraw: bool = True) -> None:
         line.set_xdata(np.array(x_vals))
         line.set_ydata(np.array(y_vals))
+        if is_redraw:
+            self.redraw()
+
+    def redraw(self) -> None:
+        """Rescale the axes to the data and draw the canvas."""
         self.ax.relim()  # type: ignore[attr-defined] # Recompute the ax.dataLim
         self.ax.autoscale_view()  # type: ignore[attr-defined] # Update ax.viewLim using the new dataLim
         self.canvas.draw()
@@ -619,10 +634,11 @@ class GearsApp(Tk):
     def next_frame(self) -> None:
         self.clock.inc()
         for i in range(2):
-            self.show_gear(i)
+            self.show_gear(i, is_redraw=False)
         self.toolbar.upd_frame_num()
-        self.show_contact_points()
-        self.show_rack()
+        self.show_contact_points(is_redraw=False)
+        self.show_rack(is_redraw=False)
+        self.redraw()  # Single canvas draw per frame
 
     def pause(self, event: Optional[KeyEvent] = None) -> None:
         self.break_loop()
@@ -638,7 +654,8 @@ class GearsApp(Tk):
         self.active_mode = False
         self.clock.reset()
         [patch.remove() for patch in self.ax.patches]  # type: ignore[attr-defined]
-        [self.plot_data(line, [], []) for line in self.ax.lines]  # type: ignore[attr-defined, arg-type, func-returns-value] # noqa: E501
+        [self.plot_data(line, [], [], is_redraw=False) for line in self.ax.lines]  # type: ignore[attr-defined, arg-type, func-returns-value] # noqa: E501
+        self.redraw()
         self.toolbar.reset_state()
         self.inputs.input_callback()
 
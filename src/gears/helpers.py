@@ -59,7 +59,8 @@ def seedrange(st: float, en: float, seed: float, step: float) -> npt.NDArray:
         Range with the given parameters.
     """
     st_ = (seed - st) % step + st
-    res = np.arange(st_, en + 0.5 * step, step, dtype=np.float_)
+    cnt = int(np.ceil((en - st_) / step + 0.5))  # Same count as the float-step arange up to en + 0.5 * step
+    res = st_ + step * np.arange(cnt, dtype=np.float64)
     if res.size and res[-1] > en:
         res = res[:-1]
     return res
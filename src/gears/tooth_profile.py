@@ -1,3 +1,5 @@
+import logging
+import math
 from typing import Any
 from typing import Callable
 from typing import cast
@@ -6,20 +8,23 @@ import numpy as np
 import numpy.typing as npt
 
 from .curves import circle
+from .curves import circle_t_range
 from .curves import epitrochoid
 from .curves import epitrochoid_angrad
 from .curves import epitrochoid_flat
 from .curves import epitrochoid_flat_angrad
 from .curves import involute
 from .curves import involute_angrad
+from .curves import involute_t_range
 from .gear_params import GearParams
 from .gear_params import STANDARD_ADDENDUM_COEF
 from .gear_params import STANDARD_DEDENDUM_COEF
 from .gear_params import STANDARD_PRESSURE_ANGLE
 from .geometry import get_unit_vector
 from .geometry import is_within_ang
-from .geometry import linecirc_intersec
-from .geometry import lineline_intersec
+from .geometry import is_within_ang_intervals
+from .geometry import is_within_ang_scalar
+from .geometry import linecirc_intersec_arr
 from .helpers import bool_to_sign
 from .helpers import Clock
 from .helpers import sci_round
@@ -31,6 +36,8 @@ from .transforms import mirror
 from .transforms import polar_to_cartesian
 from .transforms import rotate
 
+logger = logging.getLogger(__name__)
+
 RESOLUTION = 0.1
 TOLERANCE = 0.1
 
@@ -39,6 +46,9 @@ class HalfTooth(GearParams):
     """Computation of half tooth profile using given parameters."""
 
     min_r_cont: float  # Min radius where the involute-involute contact with the cutter takes place
+    half_tooth_profile: npt.NDArray  # C-contiguous float64 [[x_es...], [y_es...]]
+    x: npt.NDArray  # View of half_tooth_profile[0]
+    y: npt.NDArray  # View of half_tooth_profile[1]
 
     def __init__(self, tooth_num: int, module: float, pressure_angle_rad: float = STANDARD_PRESSURE_ANGLE,
                  ad_coef: float = STANDARD_ADDENDUM_COEF, de_coef: float = STANDARD_DEDENDUM_COEF,
@@ -54,6 +64,9 @@ class HalfTooth(GearParams):
         self.tolerance = tolerance
 
         self.is_rack = not cutter_teeth_num
+        self._tan_pa = math.tan(self.pressure_angle_rad)
+        self._sin_pa = math.sin(self.pressure_angle_rad)
+        self._cos_pa = math.cos(self.pressure_angle_rad)
         self.my_epitrochoid = cast(Callable, epitrochoid_flat if self.is_rack else epitrochoid)
         self.my_epitrochoid_angrad = epitrochoid_flat_angrad if self.is_rack else epitrochoid_angrad
 
@@ -112,7 +125,7 @@ class HalfTooth(GearParams):
         self.root_circle_lims = (-self.quater_angle, -epitrochoid_shift_ang)
 
     def _calc_shift_ang(self, radial_shift: float) -> float:
-        proj_onto_rack = radial_shift * np.tan(self.pressure_angle_rad)
+        proj_onto_rack = radial_shift * self._tan_pa
         self.shift_percent = proj_onto_rack / self.circular_pitch
         return self.tooth_angle * self.shift_percent  # Shift angle
 
@@ -136,8 +149,8 @@ class HalfTooth(GearParams):
         Returns:
             Radius and angle in polar coordinate system.
         """
-        invol_epitr_rad = np.sqrt((self.dedendum / np.tan(self.pressure_angle_rad)) ** 2 + self.root_radius ** 2)
-        invol_epitr_angle = np.pi / 2 - np.arccos(self.root_radius / invol_epitr_rad) + self.pressure_angle_rad
+        invol_epitr_rad = math.hypot(self.dedendum / self._tan_pa, self.root_radius)
+        invol_epitr_angle = math.pi / 2 - math.acos(self.root_radius / invol_epitr_rad) + self.pressure_angle_rad
         return invol_epitr_rad, invol_epitr_angle
 
     def _calc_invol_epitr(self) -> tuple[float, float]:
@@ -150,18 +163,17 @@ class HalfTooth(GearParams):
         # Solve the first triangle using the law of sines
         b = self.cutter_teeth_num * self.module / 2  # Cutting gear pitch radius
         a = b + self.dedendum
-        alpha = np.pi / 2 + self.pressure_angle_rad
-        R2t = a / np.sin(alpha)  # Radius of the triangle's circumcircle times 2
-        beta = np.arcsin(b / R2t)  # Angle beta is guarantied to be acute
-        gamma = np.pi - alpha - beta
-        c = R2t * np.sin(gamma)
+        alpha = math.pi / 2 + self.pressure_angle_rad
+        R2t = a / self._cos_pa  # Radius of the triangle's circumcircle times 2, sin(alpha) = cos(pressure angle)
+        beta = math.asin(b / R2t)  # Angle beta is guarantied to be acute
+        gamma = math.pi - alpha - beta
+        c = R2t * math.sin(gamma)
 
         # Solve the second triangle using the law of cosines
         c_ = c
         b_ = self.pitch_radius
-        alpha_ = np.pi / 2 - self.pressure_angle_rad
-        a_ = np.sqrt(b_ ** 2 + c_ ** 2 - 2 * b_ * c_ * np.cos(alpha_))
-        beta_ = np.arccos((a_ ** 2 + c_ ** 2 - b_ ** 2) / (2 * a_ * c_))
+        a_ = math.sqrt(b_ ** 2 + c_ ** 2 - 2 * b_ * c_ * self._sin_pa)  # The angle is pi / 2 - pressure angle
+        beta_ = math.acos((a_ ** 2 + c_ ** 2 - b_ ** 2) / (2 * a_ * c_))
         invol_epitr_rad, invol_epitr_angle = a_, beta_
         return invol_epitr_rad, invol_epitr_angle
 
@@ -183,34 +195,49 @@ class HalfTooth(GearParams):
         r_min = self.base_radius
         r_max = self.outside_radius
 
+        # Bisect until the angle difference is known at both ends of the bracket, then switch to the Illinois method
+        dif_min = dif_max = None
+        last_side = 0
         for _ in range(100):
-            r_curr = np.mean([r_min, r_max])
+            if dif_min is None or dif_max is None:
+                r_curr = (r_min + r_max) * 0.5
+            else:
+                r_curr = (r_min * dif_max - r_max * dif_min) / (dif_max - dif_min)
             involute_ang, _, _, involute_t_min = involute_angrad(r_curr, 0, 1, **self.involute_params)
             epitrochoid_ang, _, _, epitrochoid_t_max = self.my_epitrochoid_angrad(
                 r_curr, 0, -0.1, **self.epitrochoid_params)
             if involute_ang == epitrochoid_ang or not (r_min < r_curr < r_max):
                 break
-            if involute_ang < epitrochoid_ang:
-                r_min = r_curr
+            dif = involute_ang - epitrochoid_ang
+            if dif < 0:
+                r_min, dif_min = r_curr, dif
+                if last_side < 0 and dif_max is not None:
+                    dif_max *= 0.5  # The same end retained twice, so halve the other one to avoid stagnation
+                last_side = -1
             else:
-                r_max = r_curr
+                r_max, dif_max = r_curr, dif
+                if last_side > 0 and dif_min is not None:
+                    dif_min *= 0.5
+                last_side = 1
         else:
-            print('!!! WARNING! Number of iteration exceeded the limit.')
+            logger.warning('_find_involute_epitrochoid_intersection: Number of iteration exceeded the limit.')
 
         return involute_t_min, epitrochoid_t_max, r_curr
 
     def _build_half_tooth(self) -> None:
-        self.points_involute = equidistant(involute, self.involute_lims, self.resolution, self.tolerance,
-                                           **self.involute_params)
+        # The involute and circles have closed-form arc length, only the epitrochoid needs the iterative refinement
+        self.points_involute = involute(involute_t_range(self.involute_lims, self.resolution, self.base_radius),
+                                        **self.involute_params)
         self.points_epitrochoid = equidistant(self.my_epitrochoid, self.epitrochoid_lims, self.resolution,
                                               self.tolerance, **self.epitrochoid_params)
-        self.points_outside = equidistant(circle, self.outside_circle_lims, self.resolution, self.tolerance,
-                                          **self.outside_circle_params)
-        self.points_root = equidistant(circle, self.root_circle_lims, self.resolution, self.tolerance,
-                                       **self.root_circle_params)
+        self.points_outside = circle(circle_t_range(self.outside_circle_lims, self.resolution, self.outside_radius),
+                                     **self.outside_circle_params)
+        self.points_root = circle(circle_t_range(self.root_circle_lims, self.resolution, self.root_radius),
+                                  **self.root_circle_params)
 
-        self.half_tooth_profile = stack_curves(self.points_root, self.points_epitrochoid, self.points_involute,
-                                               self.points_outside)
+        self.half_tooth_profile = np.ascontiguousarray(stack_curves(
+            self.points_root, self.points_epitrochoid, self.points_involute, self.points_outside), dtype=np.float64)
+        self.x, self.y = self.half_tooth_profile
 
     def get_curves_equations(self) -> dict[str, dict[str, Any]]:
         return {
@@ -264,6 +291,10 @@ class HalfTooth(GearParams):
 class GearSector:
     """Builds animated gear sector."""
 
+    full_tooth_profile: npt.NDArray  # C-contiguous float64 [[x_es...], [y_es...]]
+    x: npt.NDArray  # View of full_tooth_profile[0]
+    y: npt.NDArray  # View of full_tooth_profile[1]
+
     def __init__(self, halftooth0: HalfTooth, halftooth1: HalfTooth, sector: tuple[float, float] = (0, np.pi),
                  rot_ang: float = 0, is_acw: bool = False) -> None:
         self.ht0 = halftooth0
@@ -272,85 +303,87 @@ class GearSector:
         self.rot_ang = rot_ang
         self.dir = bool_to_sign(is_acw)
         self.clock = Clock()
+        self._teeth_offsets = self.ht0.tooth_angle * np.arange(self.ht0.tooth_num)  # Angular positions of the teeth
+        self._next_teeth_ins = np.roll(np.arange(self.ht0.tooth_num), -1)  # Index of the next tooth for each tooth
         self._build_full_tooth()
+        self._tooth_angs = cartesian_to_polar(self.x, self.y)[0]  # Polar angles of the full tooth points
+        self._ang0 = self._tooth_angs[0]  # Polar angle of the first tooth start
 
     def _build_full_tooth(self) -> None:
         sec_st = np.array([0, 0])
-        sec_en = np.array([np.cos(-self.ht0.quater_angle), np.sin(-self.ht0.quater_angle)])
-        reflected = np.transpose([mirror(point, sec_st, sec_en) for point in np.transpose(self.ht1.half_tooth_profile)])
-        self.full_tooth_profile = stack_curves(reflected[:, ::-1], self.ht0.half_tooth_profile)
+        sec_en = np.array([math.cos(-self.ht0.quater_angle), math.sin(-self.ht0.quater_angle)])
+        reflected = mirror(self.ht1.half_tooth_profile, sec_st, sec_en)
+        self.full_tooth_profile = np.ascontiguousarray(stack_curves(reflected[:, ::-1], self.ht0.half_tooth_profile),
+                                                       dtype=np.float64)
+        self.x, self.y = self.full_tooth_profile
 
     def get_gear_profile(self) -> npt.NDArray:
         """Returns the entire gear profile"""
-        return populate_circ(*self.full_tooth_profile, self.ht0.tooth_num)  # type: ignore[call-arg]
+        return populate_circ(self.x, self.y, self.ht0.tooth_num)
 
     def get_sector_profile(self, sec_st: float, sec_en: float, rot_ang: float = 0) -> npt.NDArray:
+        """Returns the profile within the sector of the gear rotated by rot_ang, as a new writable array."""
         st_tooth_idx, full_teeth_ins, en_tooth_idx = self._sortout_teeth(sec_st, sec_en, rot_ang)
 
         if not full_teeth_ins.size and st_tooth_idx == en_tooth_idx:
             # Case of a single tooth within the sector
-            tooth = rotate(*self.full_tooth_profile, self.ht0.tooth_angle *
-                           st_tooth_idx + rot_ang)  # type: ignore[call-arg]
-            tooth_ang = cartesian_to_polar(*tooth)[0]
-            tooth_in_sector_bm = is_within_ang(tooth_ang, sec_st, sec_en)
-            pt_ins = np.nonzero(tooth_in_sector_bm)[0]
-            try:
-                sector_profile = tooth[:, pt_ins[0]: pt_ins[-1] + 1]
-            except IndexError:
+            tooth = rotate(self.x, self.y, self.ht0.tooth_angle * st_tooth_idx + rot_ang)
+            tooth_in_sector_bm = self._get_tooth_in_sector_bm(st_tooth_idx, sec_st, sec_en, rot_ang)
+            first_pt_idx = tooth_in_sector_bm.argmax()
+            if not tooth_in_sector_bm[first_pt_idx]:
                 raise ValueError('The segment is too narrow; no points inside!')
+            last_pt_idx = tooth_in_sector_bm.size - 1 - tooth_in_sector_bm[::-1].argmax()
+            sector_profile = tooth[:, first_pt_idx: last_pt_idx + 1]
         else:
             # Case of multiple teeth within the sector
-            curves = []
+            tooth_angle = self.ht0.tooth_angle
+            x, y = self.x, self.y
 
-            st_tooth = self._get_term_tooth_profile(st_tooth_idx, sec_st, sec_en, rot_ang, is_en=False)
-            curves.append(st_tooth)
-
-            for full_tooth_idx in full_teeth_ins:
-                full_tooth = rotate(*self.full_tooth_profile, self.ht0.tooth_angle *
-                                    full_tooth_idx + rot_ang)  # type: ignore[call-arg]
-                curves.append(full_tooth)
-
-            en_tooth = self._get_term_tooth_profile(en_tooth_idx, sec_st, sec_en, rot_ang, is_en=True)
-            curves.append(en_tooth)
+            curves = [self._get_term_tooth_profile(st_tooth_idx, sec_st, sec_en, rot_ang, is_en=False)]
+            curves += [rotate(x, y, tooth_angle * full_tooth_idx + rot_ang) for full_tooth_idx in full_teeth_ins]
+            curves.append(self._get_term_tooth_profile(en_tooth_idx, sec_st, sec_en, rot_ang, is_en=True))
 
             sector_profile = stack_curves(*curves)
 
         return sector_profile
 
     def _sortout_teeth(self, sec_st: float, sec_en: float, rot_ang: float = 0) -> tuple[int, npt.NDArray, int]:
-        ang0 = cartesian_to_polar(*self.full_tooth_profile[:, 0])[0] + rot_ang
-        teeth_sts = np.remainder(ang0 + self.ht0.tooth_angle * np.arange(self.ht0.tooth_num), np.pi * 2)
-        teeth_ens = np.roll(teeth_sts, -1)
+        teeth_sts = np.remainder(self._ang0 + rot_ang + self._teeth_offsets, np.pi * 2)
+        teeth_ens = teeth_sts[self._next_teeth_ins]
 
         teeth_sts_in_sector_bm = is_within_ang(teeth_sts, sec_st, sec_en)
         teeth_sts_in_sector_bm |= teeth_sts == sec_en  # Bug fix for missing tooth
-        teeth_ens_in_sector_bm = np.roll(teeth_sts_in_sector_bm, -1)
-        seg_st_within_tooth_bm, seg_en_within_tooth_bm = [np.array([is_within_ang(seg_edge, tooth_st, tooth_en)
-                                                                    for tooth_st, tooth_en
-                                                                    in zip(teeth_sts, teeth_ens)])
-                                                          for seg_edge in (sec_st, sec_en)]
+        teeth_ens_in_sector_bm = teeth_sts_in_sector_bm[self._next_teeth_ins]
+        seg_st_within_tooth_bm = is_within_ang_intervals(sec_st, teeth_sts, teeth_ens)
+        seg_en_within_tooth_bm = is_within_ang_intervals(sec_en, teeth_sts, teeth_ens)
         integer_teeth = np.logical_not(seg_st_within_tooth_bm | seg_en_within_tooth_bm)
         full_teeth = teeth_sts_in_sector_bm & teeth_ens_in_sector_bm & integer_teeth
 
         st_tooth_idx = np.nonzero(seg_st_within_tooth_bm)[0][0]
         full_teeth_ins = np.nonzero(full_teeth)[0]
+        # Order the full teeth starting from the one next to the start tooth
         if full_teeth_ins.size:
-            while (full_teeth_ins[0] - 1) % self.ht0.tooth_num != st_tooth_idx:
-                full_teeth_ins = np.roll(full_teeth_ins, 1)
+            shift = np.argmin((full_teeth_ins - st_tooth_idx - 1) % self.ht0.tooth_num)
+            full_teeth_ins = np.roll(full_teeth_ins, -shift)
         en_tooth_idx = np.nonzero(seg_en_within_tooth_bm)[0][0]
 
         return st_tooth_idx, full_teeth_ins, en_tooth_idx
 
+    def _get_tooth_in_sector_bm(self, tooth_idx: int, sec_st: float, sec_en: float, rot_ang: float = 0) -> (
+            npt.NDArray):
+        # Summed in the same order as the teeth starts in _sortout_teeth, so the first point gets the same angle
+        tooth_angs = np.remainder(self._tooth_angs + rot_ang + self._teeth_offsets[tooth_idx], np.pi * 2)
+        return cast(npt.NDArray, is_within_ang(tooth_angs, sec_st, sec_en))
+
     def _get_term_tooth_profile(self, tooth_idx: int, sec_st: float, sec_en: float, rot_ang: float = 0,
                                 is_en: bool = False) -> npt.NDArray:
-        tooth = rotate(*self.full_tooth_profile, self.ht0.tooth_angle * tooth_idx + rot_ang)  # type: ignore[call-arg]
-        tooth_ang = cartesian_to_polar(*tooth)[0]
-        tooth_in_sector_bm = is_within_ang(tooth_ang, sec_st, sec_en)
-        try:
-            pt_idx = np.nonzero(tooth_in_sector_bm)[0][0 - is_en] + is_en
-        except IndexError:
-            pt_idx = -1 + is_en
-        return tooth[:, :pt_idx] if is_en else tooth[:, pt_idx:]
+        tooth = rotate(self.x, self.y, self.ht0.tooth_angle * tooth_idx + rot_ang)
+        tooth_in_sector_bm = self._get_tooth_in_sector_bm(tooth_idx, sec_st, sec_en, rot_ang)
+        if is_en:
+            pt_idx = tooth_in_sector_bm.size - tooth_in_sector_bm[::-1].argmax()  # Next to the last point inside
+            return tooth[:, :pt_idx] if tooth_in_sector_bm[pt_idx - 1] else tooth[:, :0]
+        pt_idx = tooth_in_sector_bm.argmax()  # First point inside
+        return tooth[:, pt_idx:] if tooth_in_sector_bm[pt_idx] else tooth[:, -1:]
 
     def get_data(self) -> npt.NDArray:
         ang_step = self.ht0.tooth_angle / self.clock.step_cnt
@@ -369,7 +402,7 @@ class GearSector:
                 x, y = polar_to_cartesian(ang, rad)
                 xy_lims = upd_xy_lims(x, y, *xy_lims)
         for i, (x, y) in enumerate([(1, 0), (0, 1), (-1, 0), (0, -1)]):
-            if is_within_ang(i * np.pi / 2, self.sec_st, self.sec_en):
+            if is_within_ang_scalar(i * np.pi / 2, self.sec_st, self.sec_en):
                 xy_lims = upd_xy_lims(x * self.ht0.outside_radius, y * self.ht0.outside_radius, *xy_lims)
         return xy_lims
 
@@ -384,38 +417,44 @@ class Transmission:
         self.action_line1data = np.array([[self.action_line0data[0][1], self.action_line0data[0][0]],
                                           [-self.action_line0data[1][1], -self.action_line0data[1][0]]])
         self.base_step = self.tooth0.base_diameter * np.pi / self.tooth0.tooth_num
-        self.ave_contact_points = np.linalg.norm(self.action_line0data[:, 1] -  # type: ignore[attr-defined]
-                                                 self.action_line0data[:, 0]) / self.base_step
+        action_line0_len = math.hypot(*(self.action_line0data[:, 1] - self.action_line0data[:, 0]))
+        self.ave_contact_points = action_line0_len / self.base_step
+        self._action_lines_params = tuple(self._calc_action_line_params(action_line_data)
+                                          for action_line_data in (self.action_line0data, self.action_line1data))
         self.clock = Clock()
 
     def get_action_line(self) -> npt.NDArray:
         prv_x, prv_y = rotate(0, 1, self.tooth0.pressure_angle_rad)
-        res: list[float] = []
-        for tooth, sign in zip([self.tooth0, self.tooth1], [-1, 1]):
-            for attr in ['outside_radius', 'min_r_cont']:
-                res += linecirc_intersec(x1=0, y1=0, x2=prv_x, y2=prv_y, cntr_x=tooth.pitch_radius * sign, cntr_y=0,
-                                         radlen=getattr(tooth, attr))
-        res_arr = np.array(res).reshape(int(len(res) / 2), 2)
-        y_es = res_arr[:, 1]
-        pos_y_pts = res_arr[np.nonzero(y_es >= 0)[0]]
-        neg_y_pts = res_arr[np.nonzero(y_es <= 0)[0]]
-        pos_y = pos_y_pts[:, 1]
-        neg_y = neg_y_pts[:, 1]
-        min_pos = pos_y_pts[np.argmin(pos_y)]
-        max_neg = neg_y_pts[np.argmax(neg_y)]
-        action_line_data = np.transpose(np.vstack((min_pos, max_neg)))
+        cntr_x = np.repeat([-self.tooth0.pitch_radius, self.tooth1.pitch_radius], 2)
+        radlen = [self.tooth0.outside_radius, self.tooth0.min_r_cont,
+                  self.tooth1.outside_radius, self.tooth1.min_r_cont]
+        pts = linecirc_intersec_arr(x1=0, y1=0, x2=prv_x, y2=prv_y, cntr_x=cntr_x, cntr_y=0, radlen=radlen)
+        y_es = pts[1]
+        min_pos = np.argmin(np.where(y_es >= 0, y_es, np.inf))
+        max_neg = np.argmax(np.where(y_es <= 0, y_es, -np.inf))
+        action_line_data = pts[:, [min_pos, max_neg]]
         return action_line_data  # [[x0, x1], [y0, y1]]
 
-    def get_contact_points(self, action_line_data_idx: int, progress: float) -> npt.NDArray:
-        action_line_data = getattr(self, f'action_line{action_line_data_idx}data')
+    def _calc_action_line_params(self, action_line_data: npt.NDArray) -> tuple[npt.NDArray, float, float]:
+        """
+        Computes the frame invariant params of the action line.
+
+        Args:
+            action_line_data: Action line [[x0, x1], [y0, y1]].
+
+        Returns:
+            Unit vector of the line, signed distances from the origin to its start and end.
+        """
         pt0, pt1 = action_line_data[:, 0], action_line_data[:, 1]
         uv = get_unit_vector(pt1 - pt0)
-        st = -np.linalg.norm(pt0)  # type: ignore[attr-defined]
-        en = np.linalg.norm(pt1)  # type: ignore[attr-defined]
+        st = -math.hypot(*pt0)
+        en = math.hypot(*pt1)
+        return uv, st, en
+
+    def get_contact_points(self, action_line_data_idx: int, progress: float) -> npt.NDArray:
+        uv, st, en = self._action_lines_params[action_line_data_idx]
         pt_range = seedrange(st, en, self.base_step * progress, self.base_step)
-        x_es = pt_range * uv[0]
-        y_es = pt_range * uv[1]
-        return np.vstack((x_es, y_es))  # [[x_es...], [y_es...]]
+        return np.outer(uv, pt_range)  # [[x_es...], [y_es...]]
 
     def get_data(self) -> tuple[npt.NDArray, npt.NDArray]:
         contacts0_data = self.get_contact_points(0, self.clock.progress - self.tooth0.shift_percent)
@@ -436,10 +475,15 @@ class Rack:
         self.dedendum = de_coef * module
         self.addendum = ad_coef * module
         profile_shift = profile_shift_coef * module
-        tan_pressure_angle = np.tan(pressure_angle_rad)
+        tan_pressure_angle = math.tan(pressure_angle_rad)
         y_proj_de = (self.dedendum + profile_shift) * tan_pressure_angle
         y_proj_ad = (self.addendum - profile_shift) * tan_pressure_angle
-        self.seeds = [y_proj_de - self.circular_pitch / 2, -y_proj_de, y_proj_ad, -y_proj_ad + self.circular_pitch / 2]
+        # Y values of the profile corners within one circular pitch. get_data relies on them being ascending, i.e. on
+        # the root and the top lands being of non-negative width.
+        self.seeds = np.array([y_proj_de - self.circular_pitch / 2, -y_proj_de, y_proj_ad,
+                               -y_proj_ad + self.circular_pitch / 2])
+        if np.any(np.diff(self.seeds) < 0):
+            logger.warning('Rack: The flanks overlap, so the profile is malformed.')
         self.x_vals = np.array([-self.dedendum, -self.dedendum, self.addendum, self.addendum])
         self.clock = Clock()
 
@@ -458,8 +502,8 @@ class Rack:
         Returns:
             None.
         """
-        intersection_pt0 = np.sqrt(np.square(tooth0.outside_radius) - np.square(tooth0.pitch_radius - self.dedendum))
-        intersection_pt1 = np.sqrt(np.square(tooth1.outside_radius) - np.square(tooth1.pitch_radius - self.addendum))
+        intersection_pt0 = math.sqrt(tooth0.outside_radius ** 2 - (tooth0.pitch_radius - self.dedendum) ** 2)
+        intersection_pt1 = math.sqrt(tooth1.outside_radius ** 2 - (tooth1.pitch_radius - self.addendum) ** 2)
         offset_coef = max(tooth0.tooth_num, tooth1.tooth_num) / 32
         lim = max(intersection_pt0, intersection_pt1) + offset_coef * self.circular_pitch
         self.st, self.en = -lim, lim
@@ -474,35 +518,30 @@ class Rack:
         return -self.dedendum, self.st, self.addendum, self.en
 
     def get_data(self) -> npt.NDArray:
-        # Generate y values within the range
-        pt_sets = [seedrange(self.st - self.circular_pitch, self.en + self.circular_pitch,
-                             seed - self.clock.progress * self.circular_pitch, self.circular_pitch)
-                   for seed in self.seeds]
-
-        length = max([len(pt_set) for pt_set in pt_sets])
-
-        # Augment with NaNs, and convert the list of arrays into 2d array.
-        pt_sets_arr = np.array([pt_set if len(pt_set) == length else np.append(pt_set, np.nan)
-                                for pt_set in pt_sets])
-
-        # Sort sub arrays
-        rot_val = -np.argmin(pt_sets_arr[:, 0])
-        y_es = np.transpose(np.roll(pt_sets_arr, rot_val, axis=0)).flatten()
-
-        # Masking the values
-        mask = ~np.isnan(y_es)  # Mask to reject NaNs and extra values
-        x_es = np.tile(np.roll(self.x_vals, rot_val), length)[mask]
-        y_es = y_es[mask]
+        """
+        Get the rack profile of the current frame. Its ends lie exactly on the st and en boundaries.
 
-        # Stripping extra length
-        data = np.vstack((x_es, y_es))
-        i_st = np.searchsorted(y_es, self.st, side='right')
-        i_en = np.searchsorted(y_es, self.en)
-        data[:, i_st - 1] = lineline_intersec(x_es[i_st - 1], y_es[i_st - 1], x_es[i_st], y_es[i_st],
-                                              0, self.st, 1, self.st)
-        data[:, i_en] = lineline_intersec(x_es[i_en - 1], y_es[i_en - 1], x_es[i_en], y_es[i_en],
-                                          0, self.en, 1, self.en)
-        return data[:, i_st - 1: i_en + 1]
+        Returns:
+            Rack profile [[x_es...], [y_es...]], sorted by y. Valid only if the seeds are ascending.
+        """
+        # Generate y values within the range. Rows are rack periods, columns are the seeds, so the flattened buffer is
+        # sorted.
+        seeds = self.seeds - self.clock.progress * self.circular_pitch
+        y_min = self.st - self.circular_pitch
+        y_max = self.en + self.circular_pitch
+        k_st = np.floor((y_min - seeds[-1]) / self.circular_pitch)
+        k_en = np.ceil((y_max - seeds[0]) / self.circular_pitch)
+        period_sts = np.arange(k_st, k_en + 1) * self.circular_pitch
+        pt_sets_arr = np.empty((period_sts.size, seeds.size))
+        np.add.outer(period_sts, seeds, out=pt_sets_arr)
+        y_es = pt_sets_arr.ravel()
+
+        # Stripping extra length, the terminal points are moved onto the boundaries
+        i_st, i_en = np.searchsorted(y_es, (self.st, self.en))
+        data = np.vstack((np.take(self.x_vals, np.arange(i_st - 1, i_en + 1), mode='wrap'), y_es[i_st - 1: i_en + 1]))
+        data[0, [0, -1]] = np.interp((self.st, self.en), data[1], data[0])
+        data[1, [0, -1]] = self.st, self.en
+        return data
 
 
 def stack_curves(*curves) -> npt.NDArray:
@@ -515,7 +554,7 @@ def stack_curves(*curves) -> npt.NDArray:
     Returns:
         Stacked curves. Terminal points of adjacent curves are supposed to be the same, so the duplicates are removed.
     """
-    return np.hstack(tuple([line[:, 1:] if idx else line for idx, line in enumerate(curves)]))
+    return np.concatenate([curves[0]] + [curve[:, 1:] for curve in curves[1:]], axis=1)
 
 
 def populate_circ(in_x: npt.NDArray, in_y: npt.NDArray, num: int) -> npt.NDArray:
@@ -530,6 +569,8 @@ def populate_circ(in_x: npt.NDArray, in_y: npt.NDArray, num: int) -> npt.NDArray
     Returns:
         Resulting x and y values respectively.
     """
-    angle_step = 2 * np.pi / num
-    curves = [rotate(in_x, in_y, angle_step * i) for i in range(num)]
-    return stack_curves(*curves)
+    angles = 2 * np.pi / num * np.arange(num)
+    cos_angles, sin_angles = np.cos(angles), np.sin(angles)
+    rot_matrices = np.array([[cos_angles, -sin_angles], [sin_angles, cos_angles]]).transpose(2, 0, 1).reshape(-1, 2)
+    copies = (rot_matrices @ np.array((in_x, in_y))).reshape(num, 2, -1).transpose(1, 0, 2)  # (2, num, N)
+    return np.hstack((copies[:, 0], copies[:, 1:, 1:].reshape(2, -1)))  # Skip the first point of the next copies
@@ -1,17 +1,21 @@
+import logging
+import math
 from typing import Callable
-from typing import cast
 from typing import TypeVar
 
 import numpy as np
 import numpy.typing as npt
-from scipy.interpolate import interp1d  # type: ignore[import-untyped]
+
+logger = logging.getLogger(__name__)
 
 ArrOrNumG = TypeVar('ArrOrNumG', np.ndarray, float)
 
+TWO_PI = np.pi * 2
+
 
 def cartesian_to_polar(x: ArrOrNumG, y: ArrOrNumG) -> tuple[ArrOrNumG, ArrOrNumG]:
-    ang = np.remainder(np.arctan2(y, x), np.pi * 2)
-    rad = np.linalg.norm([x, y])  # type: ignore[attr-defined]
+    ang = np.remainder(np.arctan2(y, x), TWO_PI)
+    rad = np.hypot(x, y)
     return ang, rad
 
 
@@ -23,18 +27,20 @@ def polar_to_cartesian(ang: ArrOrNumG, rad: ArrOrNumG) -> tuple[ArrOrNumG, ArrOr
 
 def mirror(poi: npt.NDArray, seg_st: npt.NDArray, seg_en: npt.NDArray) -> npt.NDArray:
     """
-    Reflect the point relative to the mirror line. It is XY-invariant.
+    Reflect the points relative to the mirror line. It is XY-invariant.
 
     Args:
-        poi: Point to be reflected.
+        poi: Point [x, y] or points [[x_es...], [y_es...]] to be reflected.
         seg_st: First point of the mirror line
         seg_en: Second point of the mirror line
 
     Returns:
-        Reflected point.
+        Reflected point(s), the same shape as poi.
     """
-    seg = seg_en - seg_st  # The segment vector
-    proj_poi = seg_st + seg * np.vdot(seg, poi - seg_st) / np.vdot(seg, seg)  # Point of projection
+    shape = (2,) + (1,) * (np.ndim(poi) - 1)  # Broadcast the line over the points
+    seg_st = np.reshape(seg_st, shape)
+    seg = np.reshape(seg_en, shape) - seg_st  # The segment vector
+    proj_poi = seg_st + seg * np.sum(seg * (poi - seg_st), axis=0) / np.sum(seg * seg)  # Point of projection
     mirror_poi = proj_poi * 2 - poi  # Reflected point
     return mirror_poi
 
@@ -51,15 +57,19 @@ def rotate(x: ArrOrNumG, y: ArrOrNumG, angle: float) -> npt.NDArray:
     Returns:
         Rotated radius-vector.
     """
-    return np.array([x * np.cos(angle) - y * np.sin(angle), x * np.sin(angle) + y * np.cos(angle)])
+    cos_ang, sin_ang = math.cos(angle), math.sin(angle)
+    rot_matrix = np.array([[cos_ang, -sin_ang], [sin_ang, cos_ang]])
+    return np.matmul(rot_matrix, np.array((x, y), dtype=np.float64))
 
 
-def make_angrad_func(func: Callable) -> Callable:
+def make_angrad_func(func: Callable, dfunc: Callable | None = None) -> Callable:
     """
     Convert parametric equation f(t) -> (x, y) into explicit function f(radius) -> angle. The rad must increase with t.
 
     Args:
         func: Parametric equation f(t) -> (x, y).
+        dfunc: Parametric equation with derivatives f(t) -> (x, y, dx/dt, dy/dt). If given, the Newton steps are taken
+            within the bisection range, so it converges in a few iterations.
 
     Returns:
         Explicit function f(radius) -> angle.
@@ -79,27 +89,36 @@ def make_angrad_func(func: Callable) -> Callable:
         Returns:
             np.float64: Angle in radians from -pi to pi.
         """
-        is_t_inv = t_max < t_min
-
         # Select next range if the value is still beyond
-        while np.linalg.norm(func(t_max, *args, **kwargs)) < rad:  # type: ignore[attr-defined]
+        while math.hypot(*func(t_max, *args, **kwargs)) < rad:
             t_min, t_max = t_max, t_max + (t_max - t_min) * 2
 
         # Iteratively narrow the range of t until r matches
+        t_next = (t_min + t_max) * 0.5
         for _ in range(100):
-            t_curr = np.mean(cast(npt.NDArray, [t_min, t_max]))
-            x, y = func(t_curr, *args, **kwargs)
-            r_curr = np.linalg.norm([x, y])  # type: ignore[attr-defined]
-            if r_curr == rad or not ((t_min > t_curr > t_max) if is_t_inv else (t_min < t_curr < t_max)):
+            t_curr = t_next
+            if dfunc is None:
+                x, y = func(t_curr, *args, **kwargs)
+            else:
+                x, y, dx, dy = dfunc(t_curr, *args, **kwargs)
+            r_curr = math.hypot(x, y)
+            if r_curr == rad or t_curr == t_min or t_curr == t_max:  # The midpoint hits a bound once t is exhausted
                 break
             if r_curr < rad:
                 t_min = t_curr
             else:
                 t_max = t_curr
+            t_next = (t_min + t_max) * 0.5
+            if dfunc is not None and x * dx + y * dy != 0:
+                t_newton = t_curr - (r_curr - rad) * r_curr / (x * dx + y * dy)  # dr/dt = (x * dx + y * dy) / r
+                if t_newton == t_curr:  # Converged
+                    break
+                if (t_newton - t_min) * (t_newton - t_max) < 0:  # Take the Newton step only within the range
+                    t_next = t_newton
         else:
-            print('WARNING! angrad_func: Number of iteration exceeded the limit.')
+            logger.warning('angrad_func: Number of iteration exceeded the limit.')
 
-        ang = np.arctan2(y, x)  # Compute angle
+        ang = math.atan2(y, x)  # Compute angle
         return ang, x, y, t_curr
 
     return angrad_func
@@ -120,28 +139,31 @@ def equidistant(func: Callable, t_lims: tuple[float, float], step: float, tolera
         **kwargs: Parameters of the func.
 
     Returns:
-        Array of t params.
+        Points of the curve [[x_es...], [y_es...]].
     """
     t_st, t_en = t_lims
     seg_num = 8
-    t_step = (t_en - t_st) / seg_num
-    t_range = np.append(np.arange(t_st, t_en, t_step)[:seg_num], t_en)
+    t_range = np.linspace(t_st, t_en, seg_num + 1)
+    abs_tolerance = step * tolerance
 
     for i in range(10):
         points: npt.NDArray = func(t_range, *args, **kwargs)
-        transposed_points = np.transpose(points)
-        xy_difs = transposed_points[1:] - transposed_points[:-1]
-        dists = [np.linalg.norm(xy_dif) for xy_dif in xy_difs]  # type: ignore[attr-defined]
-        if np.all(np.absolute((np.array(dists) - step) / step) <= tolerance):  # Check inaccuracy against tolerance
+        xy_difs = np.diff(points, axis=1)
+        dists = np.hypot(xy_difs[0], xy_difs[1])
+        if np.max(np.absolute(dists - step)) <= abs_tolerance:  # Check inaccuracy against tolerance
             break
-        cum_dists = np.cumsum([0] + dists)
-        dist_t_interp_func = interp1d(cum_dists, t_range, kind='linear')
+        cum_dists = np.concatenate(([0.0], dists)).cumsum()
         total_dist = cum_dists[-1]
         seg_num = int(np.ceil(total_dist / step))
         dist_step = total_dist / seg_num
-        dist_range = np.arange(dist_step, total_dist, dist_step)[:seg_num - 1]
-        t_range = np.concatenate(([t_st], dist_t_interp_func(dist_range), [t_en]))
+        if dists.size == seg_num and np.max(np.absolute(dists - dist_step)) <= dist_step * tolerance:
+            break  # The step does not fit the curve length, but the points are already as even as they can be
+        dist_range = dist_step * np.arange(1, seg_num)
+        new_t_range = np.empty(seg_num + 1)
+        new_t_range[0], new_t_range[-1] = t_st, t_en
+        new_t_range[1:-1] = np.interp(dist_range, cum_dists, t_range)
+        t_range = new_t_range
     else:
-        print('WARNING! equidistant: Number of iteration exceeded the limit.')
+        logger.warning('equidistant: Number of iteration exceeded the limit.')
 
     return points
@@ -0,0 +1,52 @@
+from typing import Callable
+
+import numpy as np
+import pytest
+from assertpy import assert_that
+from assertpy import soft_assertions
+
+from src.gears.curves import circle
+from src.gears.curves import circle_t_range
+from src.gears.curves import epitrochoid_angrad
+from src.gears.curves import epitrochoid_flat_angrad
+from src.gears.curves import epitrochoid_flat_scalar
+from src.gears.curves import epitrochoid_scalar
+from src.gears.curves import involute
+from src.gears.curves import involute_angrad
+from src.gears.curves import involute_scalar
+from src.gears.curves import involute_t_range
+from src.gears.transforms import make_angrad_func
+
+
+@pytest.mark.parametrize(
+    'func, t_range_func, t_lims, step, r', [
+        [circle, circle_t_range, (-0.3, 0.2), 0.1, 20],
+        [circle, circle_t_range, (0.1, 0.10001), 0.1, 20],
+        [involute, involute_t_range, (0.05, 0.6), 0.05, 18.8],
+        [involute, involute_t_range, (0, 0.4), 0.2, 50]
+    ]
+)
+def test_t_range(func: Callable, t_range_func: Callable, t_lims: tuple[float, float], step: float, r: float) -> None:
+    t_range = t_range_func(t_lims, step, r)
+    dists = np.hypot(*np.diff(func(t_range, r), axis=1))
+    with soft_assertions():
+        assert_that(t_range[0], 'The first value is not the limit').is_close_to(t_lims[0], 1e-12)
+        assert_that(t_range[-1], 'The last value is not the limit').is_close_to(t_lims[1], 1e-12)
+        assert_that(dists.max(), 'The segment is too long').is_less_than_or_equal_to(step)
+        assert_that(dists.max() - dists.min(), 'The segments are uneven').is_less_than(step * 0.1)
+
+
+@pytest.mark.parametrize(
+    'angrad_func, func, rad, t_min, t_max, params', [
+        [involute_angrad, involute_scalar, 11.5, 0, 1, {'r': 10, 'a0': -0.05}],
+        [epitrochoid_angrad, epitrochoid_scalar, 19.3, 0, -0.1, {'R': 20, 'r': 9, 'd': 10.25, 'a0': -0.08}],
+        [epitrochoid_flat_angrad, epitrochoid_flat_scalar, 19.3, 0, -0.1, {'R': 20, 'l': 1.25, 'a0': -0.08}]
+    ]
+)
+def test_angrad(angrad_func: Callable, func: Callable, rad: float, t_min: float, t_max: float,
+                params: dict[str, float]) -> None:
+    ang, x, y, t = angrad_func(rad, t_min, t_max, **params)
+    t_bisection = make_angrad_func(func)(rad, t_min, t_max, **params)[3]
+    with soft_assertions():
+        assert_that(np.hypot(x, y), 'Wrong radius').is_close_to(rad, 1e-12)
+        assert_that(t, 'Result differs from the bisection').is_close_to(t_bisection, 1e-12)
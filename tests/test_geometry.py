@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+from assertpy import assert_that
+from assertpy import soft_assertions
+
+from src.gears.geometry import is_within_ang
+from src.gears.geometry import is_within_ang_intervals
+from src.gears.geometry import is_within_ang_scalar
+
+
+@pytest.mark.parametrize('q_ang', [0, 0.3, 1.2, np.pi, 5.9, 6.1])
+def test_is_within_ang_intervals(q_ang: float) -> None:
+    st_angs = np.array([0.3, 1.2, np.pi * 1.5, np.pi * 0.5, 5.9, 0.1, 2.0])
+    en_angs = np.array([1.2, 0.3, np.pi * 0.5, np.pi * 1.5, 0.2, 6.0, 2.0])
+    expected = [bool(is_within_ang(q_ang, st_ang, en_ang)) for st_ang, en_ang in zip(st_angs, en_angs)]
+    with soft_assertions():
+        assert_that(is_within_ang_intervals(q_ang, st_angs, en_angs).tolist(),
+                    'Vectorized result differs from is_within_ang').is_equal_to(expected)
+        assert_that([is_within_ang_scalar(q_ang, st_ang, en_ang) for st_ang, en_ang in zip(st_angs, en_angs)],
+                    'Scalar result differs from is_within_ang').is_equal_to(expected)
@@ -0,0 +1,86 @@
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from assertpy import assert_that
+from assertpy import soft_assertions
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+from src.gears.gui import GearsApp
+from src.gears.helpers import bool_to_sign
+from src.gears.helpers import Clock
+from src.gears.tooth_profile import GearSector
+from src.gears.tooth_profile import HalfTooth
+from src.gears.tooth_profile import Rack
+from src.gears.tooth_profile import Transmission
+
+STEP_CNT = 20
+
+
+@pytest.fixture
+def app() -> Iterator[GearsApp]:
+    """Headless app in the state set up by GearsApp.play; the Tk window and canvas are skipped."""
+    clock = Clock()
+    clock.set_step_cnt(STEP_CNT)
+    clock.i = 0
+
+    app = GearsApp.__new__(GearsApp)
+    app.ax = Figure().add_subplot()
+    for color in 'br':
+        app.ax.add_patch(Circle((0, 0), 1, color=color))
+    for _ in range(7):
+        app.ax.plot([], [])
+    app.canvas = MagicMock()
+    app.toolbar = MagicMock()
+    app.menubar = MagicMock()
+    app.menubar.has_gears = [MagicMock(**{'get.return_value': True}) for _ in range(2)]
+    app.clock = clock
+    app.active_mode = True
+
+    app.teeth = [HalfTooth(18, 2.0), HalfTooth(30, 2.0, cutter_teeth_num=18)]
+    app.gear_sectors = [
+        GearSector(app.teeth[0], app.teeth[0], sector=(np.pi * 1.5, np.pi * 0.5), rot_ang=0, is_acw=False),
+        GearSector(app.teeth[1], app.teeth[1], sector=(np.pi * 0.5, np.pi * 1.5), rot_ang=np.pi, is_acw=True)
+    ]
+    app.transmission = Transmission(*app.teeth)
+    app.rack = Rack(2.0)
+    app.rack.set_smart_boundaries(*app.teeth)
+
+    yield app
+
+    clock.set_step_cnt(1)
+    clock.i = 0
+
+
+@pytest.mark.parametrize('idx', [0, 1])
+def test_show_gear(app: GearsApp, idx: int) -> None:
+    frame = app.gear_sectors[idx].get_data()
+    frame_copy = frame.copy()
+    for _ in range(2):
+        app.show_gear(idx, is_redraw=False)
+    line = app.ax.lines[idx]
+    with soft_assertions():
+        assert_that(np.array_equal(line.get_xdata(), frame_copy[0] + bool_to_sign(idx) * app.teeth[idx].pitch_radius),
+                    'Gear is not shifted to its center').is_true()
+        assert_that(np.array_equal(line.get_ydata(), frame_copy[1]), 'Wrong y values').is_true()
+        assert_that(np.array_equal(frame, frame_copy), 'The frame returned by get_data is modified').is_true()
+
+
+def test_next_frame(app: GearsApp) -> None:
+    with soft_assertions():
+        for i in range(1, STEP_CNT + 1):
+            app.next_frame()
+            assert_that(app.clock.i, 'Wrong frame index').is_equal_to(i % STEP_CNT)
+            for idx in range(2):
+                x_vals, y_vals = app.gear_sectors[idx].get_data()
+                line = app.ax.lines[idx]
+                assert_that(np.array_equal(line.get_xdata(), x_vals + bool_to_sign(idx) * app.teeth[idx].pitch_radius),
+                            f'Gear {idx} x values differ in frame {i}').is_true()
+                assert_that(np.array_equal(line.get_ydata(), y_vals),
+                            f'Gear {idx} y values differ in frame {i}').is_true()
+            assert_that(np.array_equal(np.array([app.ax.lines[6].get_xdata(), app.ax.lines[6].get_ydata()]),
+                                       app.rack.get_data()), f'Rack differs in frame {i}').is_true()
+        assert_that(app.canvas.draw.call_count, 'The canvas must be drawn once per frame').is_equal_to(STEP_CNT)
+        assert_that(app.toolbar.upd_frame_num.call_count, 'Frame number not updated').is_equal_to(STEP_CNT)
@@ -3,7 +3,7 @@ import pytest
 from assertpy import assert_that
 from assertpy import soft_assertions
 
-from src.gears import seedrange
+from src.gears.helpers import seedrange
 
 
 @pytest.mark.parametrize(
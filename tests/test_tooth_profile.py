@@ -0,0 +1,146 @@
+from typing import Iterator
+
+import numpy as np
+import pytest
+from assertpy import assert_that
+from assertpy import soft_assertions
+
+from src.gears.helpers import Clock
+from src.gears.tooth_profile import GearSector
+from src.gears.tooth_profile import HalfTooth
+from src.gears.tooth_profile import Rack
+from src.gears.tooth_profile import Transmission
+from src.gears.transforms import cartesian_to_polar
+from src.gears.transforms import rotate
+
+STEP_CNT = 50
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    clock = Clock()
+    clock.set_step_cnt(STEP_CNT)
+    clock.i = 0
+    yield clock
+    clock.set_step_cnt(1)
+    clock.i = 0
+
+
+@pytest.mark.parametrize(
+    'sec_st, sec_en', [
+        [0.3, 0.5],  # Single tooth
+        [0.1, 0.3],  # Two partial teeth
+        [0, np.pi]  # Full teeth in between
+    ]
+)
+def test_get_sector_profile_is_new_array(sec_st: float, sec_en: float) -> None:
+    halftooth = HalfTooth(9, 2.0)
+    gear_sector = GearSector(halftooth, halftooth)
+    profile0 = gear_sector.get_sector_profile(sec_st, sec_en, 0.05)
+    profile1 = gear_sector.get_sector_profile(sec_st, sec_en, 0.05)
+    with soft_assertions():
+        assert_that(profile0.flags.writeable, 'The profile is read-only').is_true()
+        assert_that(np.shares_memory(profile0, profile1), 'The profiles share memory').is_false()
+        assert_that(np.shares_memory(profile0, gear_sector.full_tooth_profile),
+                    'The profile shares memory with the tooth').is_false()
+
+
+@pytest.mark.parametrize(
+    'tooth_num, module, cutter_teeth_num', [
+        [18, 2.0, 0],
+        [30, 2.0, 18],
+        [9, 1.0, 18],
+        [5, 1.0, 0]
+    ]
+)
+@pytest.mark.parametrize(
+    'sector, rot_ang, is_acw', [
+        [(np.pi * 1.5, np.pi * 0.5), 0, False],
+        [(np.pi * 0.5, np.pi * 1.5), np.pi, True],
+        [(0.2, 1.0), 0, False]
+    ]
+)
+def test_gear_sector_frames(clock: Clock, tooth_num: int, module: float, cutter_teeth_num: int,
+                            sector: tuple[float, float], rot_ang: float, is_acw: bool) -> None:
+    halftooth = HalfTooth(tooth_num, module, cutter_teeth_num=cutter_teeth_num)
+    gear_sector = GearSector(halftooth, halftooth, sector=sector, rot_ang=rot_ang, is_acw=is_acw)
+    max_step = halftooth.resolution * (1 + halftooth.tolerance)
+    edges = np.array([[np.cos(ang), np.sin(ang)] for ang in sector])  # Unit vectors of the sector edges
+    with soft_assertions():
+        for i in range(STEP_CNT):
+            clock.i = i
+            frame = gear_sector.get_data()
+            steps = np.hypot(*np.diff(frame, axis=1))
+            assert_that(steps.max(), f'Gap in frame {i}').is_less_than_or_equal_to(max_step)
+            for edge, pt in zip(edges, frame[:, [0, -1]].T):
+                assert_that(abs(np.cross(edge, pt)),
+                            f'Terminal point is off the edge in frame {i}').is_less_than(max_step)
+                assert_that(np.dot(edge, pt), f'Terminal point is behind the center in frame {i}').is_positive()
+
+
+@pytest.mark.parametrize(
+    'tooth_num, module, cutter_teeth_num', [
+        [18, 2.0, 0],
+        [9, 1.0, 18]
+    ]
+)
+def test_gear_sector_tooth_start_on_edge(tooth_num: int, module: float, cutter_teeth_num: int) -> None:
+    halftooth = HalfTooth(tooth_num, module, cutter_teeth_num=cutter_teeth_num)
+    gear_sector = GearSector(halftooth, halftooth)
+    ang0 = cartesian_to_polar(gear_sector.x[0], gear_sector.y[0])[0]
+    with soft_assertions():
+        for tooth_idx in range(tooth_num):
+            for rot_ang in np.linspace(0, np.pi * 2, 7):
+                sec_st = np.remainder(ang0 + rot_ang + halftooth.tooth_angle * tooth_idx, np.pi * 2)
+                profile = gear_sector.get_sector_profile(sec_st, np.remainder(sec_st + 1.0, np.pi * 2), rot_ang)
+                tooth = rotate(gear_sector.x, gear_sector.y, halftooth.tooth_angle * tooth_idx + rot_ang)
+                assert_that(np.allclose(profile[:, 0], tooth[:, 0], rtol=0, atol=1e-9),
+                            f'Start of tooth {tooth_idx} is dropped at rot_ang {rot_ang}').is_true()
+
+
+@pytest.mark.parametrize(
+    'module, pressure_angle_rad, ad_coef, de_coef, profile_shift_coef', [
+        [1.0, np.deg2rad(20), 1, 1.25, 0],
+        [2.5, np.deg2rad(20), 1, 1.25, 0.4],
+        [2.0, np.deg2rad(14.5), 1.2, 1.0, -0.3],
+        [1.0, np.deg2rad(25), 1, 1, 0]
+    ]
+)
+def test_rack(clock: Clock, caplog: pytest.LogCaptureFixture, module: float, pressure_angle_rad: float,
+              ad_coef: float, de_coef: float, profile_shift_coef: float) -> None:
+    rack = Rack(module, pressure_angle_rad, ad_coef, de_coef, profile_shift_coef)
+    rack.set_smart_boundaries(HalfTooth(18, module), HalfTooth(30, module))
+    with soft_assertions():
+        assert_that(caplog.text, 'The seeds are not ascending').is_empty()
+        for i in range(0, STEP_CNT, 7):
+            clock.i = i
+            x_es, y_es = rack.get_data()
+            assert_that(y_es[[0, -1]].tolist(), f'Ends are off the boundaries in frame {i}').is_equal_to(
+                [rack.st, rack.en])
+            assert_that(np.all(np.diff(y_es) >= 0), f'Y values are not sorted in frame {i}').is_true()
+            assert_that(np.isin(x_es[1:-1], (-rack.dedendum, rack.addendum)).all(),
+                        f'Inner points are off the root or the top lines in frame {i}').is_true()
+            assert_that(np.all((-rack.dedendum <= x_es[[0, -1]]) & (x_es[[0, -1]] <= rack.addendum)),
+                        f'Terminal points are out of the rack in frame {i}').is_true()
+
+
+def test_rack_overlapping_flanks(caplog: pytest.LogCaptureFixture) -> None:
+    Rack(1.0, 0.6, 1, 1.25)
+    assert_that(caplog.text, 'No warning about the overlapping flanks').contains('The flanks overlap')
+
+
+@pytest.mark.parametrize(
+    'tooth0_kwargs, tooth1_kwargs, expected', [
+        [{'tooth_num': 18, 'module': 2.0}, {'tooth_num': 30, 'module': 2.0},
+         [[-1.6695338115817115, 1.5445866369581012], [4.587006448336737, -4.243716907433728]]],
+        [{'tooth_num': 9, 'module': 1.0, 'cutter_teeth_num': 18}, {'tooth_num': 25, 'module': 1.0},
+         [[-0.3555697503031281, 0.6764610644502094], [0.9769198599989644, -1.8585614997171878]]],
+        [{'tooth_num': 12, 'module': 3.0, 'profile_shift_coef': 0.3},
+         {'tooth_num': 12, 'module': 3.0, 'profile_shift_coef': -0.3},
+         [[-1.4374754110732404, 1.4374754110732582], [3.94943123294498, -3.9494312329450345]]]
+    ]
+)
+def test_action_line(tooth0_kwargs: dict, tooth1_kwargs: dict, expected: list[list[float]]) -> None:
+    transmission = Transmission(HalfTooth(**tooth0_kwargs), HalfTooth(**tooth1_kwargs))
+    assert_that(np.allclose(transmission.action_line0data, expected, rtol=0, atol=1e-9),
+                f'Action line {transmission.action_line0data.tolist()} differs from the expected one').is_true()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from assertpy import assert_that
+from assertpy import soft_assertions
+
+from src.gears.curves import epitrochoid_flat
+from src.gears.transforms import cartesian_to_polar
+from src.gears.transforms import equidistant
+from src.gears.transforms import mirror
+
+
+@pytest.mark.parametrize(
+    'seg_st, seg_en', [
+        [(0, 0), (1, 0)],
+        [(0, 0), (0.9, -0.3)],
+        [(-1.5, 2.5), (3.2, 0.7)]
+    ]
+)
+def test_mirror(seg_st: tuple[float, float], seg_en: tuple[float, float]) -> None:
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-10, 10, (2, 50))
+    reflected = mirror(points, np.array(seg_st), np.array(seg_en))
+    with soft_assertions():
+        assert_that(reflected.shape, 'Shape is not preserved').is_equal_to(points.shape)
+        for point, reflected_point in zip(np.transpose(points), np.transpose(reflected)):
+            single = mirror(point, np.array(seg_st), np.array(seg_en))
+            assert_that(np.allclose(single, reflected_point), 'Array and single point results differ').is_true()
+        assert_that(np.allclose(mirror(reflected, np.array(seg_st), np.array(seg_en)), points),
+                    'Double reflection is not identity').is_true()
+
+
+def test_cartesian_to_polar() -> None:
+    x = np.array([1, 0, -2, 0, 3])
+    y = np.array([0, 1, 0, -2, 4])
+    ang, rad = cartesian_to_polar(x, y)
+    with soft_assertions():
+        assert_that(np.allclose(ang, [0, np.pi / 2, np.pi, np.pi * 3 / 2, np.arctan2(4, 3)]), 'Wrong angles').is_true()
+        assert_that(np.allclose(rad, [1, 1, 2, 2, 5]), 'Wrong radii').is_true()
+
+
+@pytest.mark.parametrize('t_en', [-0.1, -0.23, -0.5])
+def test_equidistant(t_en: float, caplog: pytest.LogCaptureFixture) -> None:
+    step, tolerance = 0.1, 0.1
+    points = equidistant(epitrochoid_flat, (0, t_en), step, tolerance, R=12.5, l=1.25)
+    dists = np.linalg.norm(np.diff(points, axis=1), axis=0)
+    with soft_assertions():
+        assert_that(np.allclose(points[:, [0, -1]], epitrochoid_flat(np.array([0, t_en]), R=12.5, l=1.25)),
+                    'Terminal points are moved').is_true()
+        assert_that(np.all(np.absolute(dists / dists.mean() - 1) <= tolerance), 'Points are not even').is_true()
+        assert_that(caplog.text, 'Refinement did not converge').is_empty()